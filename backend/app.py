@@ -1,16 +1,32 @@
 """
 Flask API server for AstroGuard: Earth's Sentinel
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
-import requests
+from flask_compress import Compress
+import orjson
+import pybreaker
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from functools import lru_cache
+import atexit
 import os
 import math
+import time
+from types import MappingProxyType
 from physics import (
     calculate_kinetic_energy, 
+    calculate_kinetic_energy_batch,
     calculate_trajectory, 
+    calculate_trajectories_batch,
     deflect_trajectory,
+    deflect_semi_major_axis_batch,
     calculate_impact_effects,
+    calculate_impact_effects_batch,
     calculate_combined_effects
 )
 from historical_impacts import (
@@ -22,20 +38,127 @@ import numpy as np
 app = Flask(__name__)
 CORS(app)
 
+# Compress larger JSON payloads (trajectories, NEO feeds); Brotli preferred
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
+
 # NASA API endpoints
 SENTRY_API_URL = "https://ssd-api.jpl.nasa.gov/sentry.api"
 SBDB_API_URL = "https://ssd-api.jpl.nasa.gov/sbdb.api"
 
 # USGS API endpoint
 USGS_ELEVATION_URL = "https://elevation.nationalmap.gov/EPQS/v1/json"
+USGS_NO_DATA = -1000000.0  # EPQS value for points outside its coverage
+
+# Open-Meteo elevation endpoint (fallback when USGS has no data)
+OPEN_METEO_ELEVATION_URL = "https://api.open-meteo.com/v1/elevation"
+ELEVATION_HEADERS = {"User-Agent": "AstroGuard/1.0 (education)"}
+ELEVATION_TIMEOUT = 5  # seconds to wait for the first elevation provider
+ELEVATION_USGS_GRACE = 1.0  # seconds USGS gets before an Open-Meteo answer is used
 
 # NASA NEO API endpoint (Near Earth Object Web Service)
 NEO_API_URL = "https://api.nasa.gov/neo/rest/v1/feed"
 NASA_API_KEY = "DEMO_KEY"  # Free demo key, works for limited requests
 
+# Upstream responses are cached on disk; orbital and terrain data change slowly
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'astroguard_cache')
+CACHE_EXPIRE_AFTER = {
+    'ssd-api.jpl.nasa.gov/sentry.api': 3600,
+    'ssd-api.jpl.nasa.gov/sbdb.api': 86400,
+    'api.nasa.gov/neo/rest/v1/feed': 600,
+    'elevation.nationalmap.gov': 86400 * 30,
+    'api.open-meteo.com/v1/elevation': 86400 * 30,
+}
+
+# Shared HTTP session so upstream calls reuse pooled keep-alive connections
+SESSION = requests_cache.CachedSession(
+    CACHE_PATH,
+    backend='sqlite',
+    expire_after=3600,
+    urls_expire_after=CACHE_EXPIRE_AFTER,
+    allowable_methods=('GET',)
+)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # Retry refused connections and gateway errors, but not read timeouts: a
+    # hung upstream should cost one timeout, not three
+    max_retries=Retry(total=2, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+def _is_client_error(exc):
+    """
+    True for 4xx responses, which are caused by the request (e.g. an unknown
+    designation) rather than by the upstream being unhealthy.
+    """
+    return (
+        isinstance(exc, HTTPError) and
+        exc.response is not None and
+        exc.response.status_code < 500
+    )
+
+# One circuit breaker per upstream: after 5 consecutive failures the upstream
+# is skipped for 30 s, so requests fall back at once instead of waiting on
+# timeouts. Client errors do not count as failures.
+SBDB_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5, reset_timeout=30, exclude=[_is_client_error], name='sbdb')
+SENTRY_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5, reset_timeout=30, exclude=[_is_client_error], name='sentry')
+NEO_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5, reset_timeout=30, exclude=[_is_client_error], name='neows')
+USGS_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5, reset_timeout=30, exclude=[_is_client_error], name='usgs')
+OPEN_METEO_BREAKER = pybreaker.CircuitBreaker(
+    fail_max=5, reset_timeout=30, exclude=[_is_client_error], name='open-meteo')
+
+# Worker pool shared by all handlers for issuing independent upstream
+# requests concurrently; its size also bounds total outbound concurrency
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix='astroguard-io'
+)
+atexit.register(EXECUTOR.shutdown, wait=False)
+
+# Elevation lookups run under a deadline, so they get their own pool; queued
+# behind slow SBDB calls they would time out before they even started
+ELEVATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix='astroguard-elevation'
+)
+atexit.register(ELEVATION_EXECUTOR.shutdown, wait=False)
+
 # Unit conversion helpers
 AU_IN_METERS = 149597870700.0
 
+# Keplerian element key, SBDB orbital_data field and default value, ordered
+# as semi-major axis (AU), eccentricity, then the four angles (degrees)
+ORBITAL_ELEMENT_FIELDS = [
+    ('a', 'semi_major_axis', 1.0),
+    ('e', 'eccentricity', 0.1),
+    ('i', 'inclination', 0),
+    ('omega', 'longitude_of_ascending_node', 0),
+    ('w', 'argument_of_periapsis', 0),
+    ('M', 'mean_anomaly', 0),
+]
+ORBITAL_ELEMENT_KEYS = [key for key, _, _ in ORBITAL_ELEMENT_FIELDS]
+
+# Asteroid used when the SBDB lookup fails, already in SI units
+FALLBACK_ORBITAL_ELEMENTS = MappingProxyType({
+    'a': 1.5 * AU_IN_METERS,
+    'e': 0.1,
+    'i': 0.0,
+    'omega': 0.0,
+    'w': 0.0,
+    'M': 0.0
+})
+FALLBACK_DIAMETER = 100.0  # meters
+FALLBACK_VELOCITY = 20000.0  # m/s
+
+# Trajectory colors for multi-asteroid simulations: red, orange, green, blue, purple
+COLORS = ('#ef4444', '#f59e0b', '#10b981', '#3b82f6', '#8b5cf6')
+
 def _to_float(value, default=0.0):
     try:
         if isinstance(value, (int, float)):
@@ -46,11 +169,208 @@ def _to_float(value, default=0.0):
         pass
     return float(default)
 
-def _au_to_meters(value):
-    return _to_float(value) * AU_IN_METERS
+def _parse_orbital_elements(orbital_data):
+    """
+    Convert SBDB orbital_data into Keplerian elements in one vectorized pass.
+    SBDB reports the semi-major axis in AU and the angles in degrees (as
+    strings); these become meters and radians.
+    """
+    raw = [orbital_data.get(field, default) for _, field, default in ORBITAL_ELEMENT_FIELDS]
+    try:
+        values = np.array(raw, dtype=np.float64)
+        # None converts to NaN rather than raising
+        if np.isnan(values).any():
+            raise ValueError('missing orbital element')
+    except (TypeError, ValueError):
+        # Malformed entries get the same per-value handling as _to_float
+        values = np.array([_to_float(value) for value in raw], dtype=np.float64)
+    values[0] *= AU_IN_METERS
+    values[2:] = np.deg2rad(values[2:])
+    return dict(zip(ORBITAL_ELEMENT_KEYS, values.tolist()))
+
+@lru_cache(maxsize=1024)
+def _trajectory_cached(a, e, i, omega, w, M):
+    """
+    Trajectory for one set of orbital elements. The cached array is shared
+    between requests, so it is marked read-only.
+    """
+    trajectory = calculate_trajectory({'a': a, 'e': e, 'i': i, 'omega': omega, 'w': w, 'M': M})
+    trajectory.flags.writeable = False
+    return trajectory
+
+def _get_trajectory(orbital_elements):
+    """
+    Trajectory for the given orbital elements, memoized on the elements
+    rounded to 1e-6 so repeated simulations skip the Kepler propagation.
+    """
+    return _trajectory_cached(*(round(orbital_elements[key], 6) for key in ORBITAL_ELEMENT_KEYS))
+
+@NEO_BREAKER
+def _fetch_neo_feed(params):
+    """
+    Fetch and parse the NASA NeoWs feed for the given date range.
+    """
+    response = SESSION.get(NEO_API_URL, params=params, timeout=15)
+    response.raise_for_status()
+    return response.json()
+
+def _json_default(obj):
+    """Encode types orjson does not handle natively (read-only mappings)."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
+
+def ojsonify(obj):
+    """
+    Serialize obj to a JSON response with orjson; NumPy arrays and scalars
+    are encoded natively.
+    """
+    return Response(
+        orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ),
+        mimetype='application/json'
+    )
+
+@SENTRY_BREAKER
+def _fetch_sentry():
+    """
+    Fetch and parse the NASA Sentry list of potential impactors.
+    """
+    response = SESSION.get(SENTRY_API_URL, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+@SBDB_BREAKER
+def _fetch_sbdb(asteroid_id):
+    """
+    Fetch and parse the SBDB record for an asteroid. Shared by the details
+    and simulate endpoints; the HTTP cache means inspecting then simulating
+    costs one upstream request.
+    """
+    response = SESSION.get(SBDB_API_URL, params={'des': asteroid_id}, timeout=10)
+    response.raise_for_status()
+    return response.json()
 
-def _deg_to_rad(value):
-    return math.radians(_to_float(value))
+@USGS_BREAKER
+def _fetch_usgs_elevation(lat, lon):
+    """
+    Query the USGS Elevation Point Query Service for elevation in meters.
+    """
+    params = {
+        'x': lon,
+        'y': lat,
+        'units': 'Meters',
+        'output': 'json'
+    }
+    response = SESSION.get(USGS_ELEVATION_URL, params=params, headers=ELEVATION_HEADERS, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    # USGS EPQS structure: { USGS_Elevation_Point_Query_Service: { Elevation_Query: { Elevation, Units, ... }}}
+    elevation = (
+        data.get('USGS_Elevation_Point_Query_Service', {})
+            .get('Elevation_Query', {})
+            .get('Elevation', None)
+    )
+    # EPQS only covers the US; elsewhere it omits the value or reports its
+    # -1000000 no-data marker, which must not be mistaken for sea level
+    if elevation is None:
+        return None
+    elevation = _to_float(elevation, USGS_NO_DATA)
+    return None if elevation <= USGS_NO_DATA else elevation
+
+@OPEN_METEO_BREAKER
+def _fetch_open_meteo_elevation(lat, lon):
+    """
+    Query the Open-Meteo Elevation API for elevation in meters.
+    """
+    response = SESSION.get(
+        OPEN_METEO_ELEVATION_URL,
+        params={'latitude': lat, 'longitude': lon},
+        timeout=10
+    )
+    response.raise_for_status()
+    data = response.json()
+    # Structure: { "elevation": [value], "latitude": [...], "longitude": [...] }
+    arr = data.get('elevation')
+    if isinstance(arr, list) and len(arr) > 0:
+        return _to_float(arr[0], 0.0)
+    return None
+
+def _elevation_result(future):
+    """
+    Elevation from a finished provider future, or None if it failed or had
+    no data.
+    """
+    if future.exception() is not None:
+        return None
+    return future.result()
+
+def _lookup_elevation(lat, lon):
+    """
+    Look up surface elevation in meters. USGS is preferred; Open-Meteo is
+    queried at the same time, but its answer is only used once USGS has
+    failed, had no data, or not answered within ELEVATION_USGS_GRACE
+    seconds. Returns None if neither provider has data and raises
+    TimeoutError if no answer arrives within ELEVATION_TIMEOUT seconds.
+    """
+    deadline = time.monotonic() + ELEVATION_TIMEOUT
+    providers = [
+        ELEVATION_EXECUTOR.submit(fetch, lat, lon)
+        for fetch in (_fetch_usgs_elevation, _fetch_open_meteo_elevation)
+    ]
+    wait(providers[:1], timeout=ELEVATION_USGS_GRACE)
+    
+    pending = set(providers)
+    while True:
+        pending = {future for future in pending if not future.done()}
+        # Finished providers in order of preference
+        for future in providers:
+            if future not in pending:
+                elevation = _elevation_result(future)
+                if elevation is not None:
+                    # The other request cannot be interrupted once started; it
+                    # finishes in the background and still warms the HTTP cache
+                    for other in pending:
+                        other.cancel()
+                    return elevation
+        if not pending:
+            return None
+        
+        done, _ = wait(
+            pending,
+            timeout=max(0.0, deadline - time.monotonic()),
+            return_when=FIRST_COMPLETED
+        )
+        if not done:
+            for future in pending:
+                future.cancel()
+            raise TimeoutError(f"Elevation lookup for ({lat}, {lon}) timed out")
+
+@lru_cache(maxsize=8192)
+def _elevation_cached(lat_q, lon_q):
+    """
+    Elevation for a grid cell given by coordinates rounded to 3 decimals
+    (~100 m). Raises LookupError when no provider has data, or TimeoutError
+    when none answers in time, so that failures are retried instead of cached.
+    """
+    elevation = _lookup_elevation(lat_q, lon_q)
+    if elevation is None:
+        raise LookupError(f"No elevation data for ({lat_q}, {lon_q})")
+    return elevation
+
+def _get_elevation(lat, lon):
+    """
+    Elevation in meters at the given coordinates, or 0.0 if no provider has
+    data. Raises TimeoutError when the providers do not answer in time, as
+    guessing 0.0 then could turn an ocean impact into a land impact.
+    """
+    try:
+        return _elevation_cached(round(lat, 3), round(lon, 3))
+    except LookupError:
+        return 0.0
 
 @app.route('/api/asteroids', methods=['GET'])
 def get_asteroids():
@@ -58,10 +378,7 @@ def get_asteroids():
     Fetch list of potentially hazardous asteroids from NASA Sentry API.
     """
     try:
-        response = requests.get(SENTRY_API_URL, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = _fetch_sentry()
         asteroids = []
         
         # Process the first 5 asteroids for simplicity
@@ -76,13 +393,13 @@ def get_asteroids():
             }
             asteroids.append(asteroid)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'asteroids': asteroids
         })
     
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -93,32 +410,19 @@ def get_asteroid_details(asteroid_id):
     Get detailed orbital elements for a specific asteroid.
     """
     try:
-        response = requests.get(f"{SBDB_API_URL}?des={asteroid_id}", timeout=10)
-        response.raise_for_status()
+        data = _fetch_sbdb(asteroid_id)
         
-        data = response.json()
-        orbital_data = data.get('orbital_data', {})
-
         # Extract Keplerian elements with proper unit conversions
-        elements = {
-            # SBDB semi_major_axis is in AU (string) → meters
-            'a': _au_to_meters(orbital_data.get('semi_major_axis', 1.0)),
-            'e': _to_float(orbital_data.get('eccentricity', 0.1)),
-            # SBDB angles are in degrees (strings) → radians
-            'i': _deg_to_rad(orbital_data.get('inclination', 0)),
-            'omega': _deg_to_rad(orbital_data.get('longitude_of_ascending_node', 0)),
-            'w': _deg_to_rad(orbital_data.get('argument_of_periapsis', 0)),
-            'M': _deg_to_rad(orbital_data.get('mean_anomaly', 0)),
-        }
+        elements = _parse_orbital_elements(data.get('orbital_data', {}))
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'orbital_elements': elements,
             'name': data.get('object', {}).get('fullname', asteroid_id)
         })
     
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -133,56 +437,22 @@ def get_elevation():
         lon = request.args.get('lon')
         
         if not lat or not lon:
-            return jsonify({'error': 'Latitude and longitude required'}), 400
+            return ojsonify({'error': 'Latitude and longitude required'}), 400
         
-        params = {
-            'x': lon,
-            'y': lat,
-            'units': 'Meters',
-            'output': 'json'
-        }
+        elevation = _get_elevation(float(lat), float(lon))
         
-        elevation = None
-        try:
-            headers = {"User-Agent": "AstroGuard/1.0 (education)"}
-            response = requests.get(USGS_ELEVATION_URL, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            # USGS EPQS structure: { USGS_Elevation_Point_Query_Service: { Elevation_Query: { Elevation, Units, ... }}}
-            elevation = _to_float(
-                data.get('USGS_Elevation_Point_Query_Service', {})
-                    .get('Elevation_Query', {})
-                    .get('Elevation', None)
-            )
-        except Exception:
-            elevation = None
-
-        # Fallback: Open-Meteo Elevation API
-        if elevation is None:
-            try:
-                om_resp = requests.get(
-                    f"https://api.open-meteo.com/v1/elevation?latitude={lat}&longitude={lon}",
-                    timeout=10
-                )
-                om_resp.raise_for_status()
-                om_data = om_resp.json()
-                # Structure: { "elevation": [value], "latitude": [...], "longitude": [...] }
-                arr = om_data.get('elevation')
-                if isinstance(arr, list) and len(arr) > 0:
-                    elevation = _to_float(arr[0], 0.0)
-            except Exception:
-                elevation = None
-
-        if elevation is None:
-            elevation = 0.0
-        
-        return jsonify({
+        return ojsonify({
             'success': True,
             'elevation': elevation
         })
     
+    except TimeoutError as e:
+        return ojsonify({
+            'success': False,
+            'error': str(e)
+        }), 503
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -200,105 +470,68 @@ def simulate_impact():
         impact_lon = float(data.get('impactLon', -118.24))
         mitigation_delta_v = float(data.get('mitigationDeltaV', 0))
         
+        # Fetch asteroid details in the background while the elevation
+        # providers are queried, so all upstream requests are in flight at once
+        sbdb_future = EXECUTOR.submit(_fetch_sbdb, asteroid_id)
+        try:
+            elevation = _get_elevation(impact_lat, impact_lon)
+        except TimeoutError as e:
+            # Without the elevation the target type and tsunami risk are unknown
+            return ojsonify({
+                'success': False,
+                'error': str(e)
+            }), 503
+        
         # Get asteroid details with fallback
         try:
-            asteroid_response = requests.get(f"{SBDB_API_URL}?des={asteroid_id}", timeout=10)
-            asteroid_data = asteroid_response.json()
+            asteroid_data = sbdb_future.result()
         except Exception as e:
             print(f"SBDB API failed for {asteroid_id}: {e}")
             # Use fallback data
-            asteroid_data = {
-                'orbital_data': {
-                    'semi_major_axis': '1.5',
-                    'eccentricity': '0.1',
-                    'inclination': '0',
-                    'longitude_of_ascending_node': '0',
-                    'argument_of_periapsis': '0',
-                    'mean_anomaly': '0'
-                },
-                'physical_data': {
-                    'diameter': '0.1',
-                    'v_inf': '20.0'
-                },
-                'object': {'fullname': asteroid_id}
-            }
-        
-        # Get orbital elements
-        orbital_data = asteroid_data.get('orbital_data', {})
-        orbital_elements = {
-            'a': _au_to_meters(orbital_data.get('semi_major_axis', 1.0)),
-            'e': _to_float(orbital_data.get('eccentricity', 0.1)),
-            'i': _deg_to_rad(orbital_data.get('inclination', 0)),
-            'omega': _deg_to_rad(orbital_data.get('longitude_of_ascending_node', 0)),
-            'w': _deg_to_rad(orbital_data.get('argument_of_periapsis', 0)),
-            'M': _deg_to_rad(orbital_data.get('mean_anomaly', 0)),
-        }
-        
-        # Get asteroid physical properties
-        physical_data = asteroid_data.get('physical_data', {})
-        # diameter reported in km (string) → meters
-        diameter_km = _to_float(physical_data.get('diameter', 0.1))
-        diameter = diameter_km * 1000.0
-        # v_inf usually not in SBDB; fall back to a typical impact velocity (km/s)
-        velocity_kms = _to_float(physical_data.get('v_inf', 20.0))
-        velocity = velocity_kms * 1000.0
+            orbital_elements = dict(FALLBACK_ORBITAL_ELEMENTS)
+            diameter = FALLBACK_DIAMETER
+            velocity = FALLBACK_VELOCITY
+            asteroid_name = asteroid_id
+        else:
+            # Get orbital elements
+            orbital_elements = _parse_orbital_elements(asteroid_data.get('orbital_data', {}))
+            
+            # Get asteroid physical properties
+            physical_data = asteroid_data.get('physical_data', {})
+            # diameter reported in km (string) → meters
+            diameter_km = _to_float(physical_data.get('diameter', 0.1))
+            diameter = diameter_km * 1000.0
+            # v_inf usually not in SBDB; fall back to a typical impact velocity (km/s)
+            velocity_kms = _to_float(physical_data.get('v_inf', 20.0))
+            velocity = velocity_kms * 1000.0
+            
+            asteroid_name = asteroid_data.get('object', {}).get('fullname', asteroid_id)
         
         # Calculate impact energy
         impact_energy_mt = calculate_kinetic_energy(diameter, velocity)
         
-        # Get elevation data
-        elevation = None
-        try:
-            headers = {"User-Agent": "AstroGuard/1.0 (education)"}
-            elevation_response = requests.get(
-                f"{USGS_ELEVATION_URL}?x={impact_lon}&y={impact_lat}&units=Meters&output=json",
-                headers=headers,
-                timeout=10
-            )
-            elevation_response.raise_for_status()
-            elevation_data = elevation_response.json()
-            elevation = _to_float(
-                elevation_data.get('USGS_Elevation_Point_Query_Service', {})
-                    .get('Elevation_Query', {})
-                    .get('Elevation', None)
-            )
-        except Exception:
-            elevation = None
-
-        if elevation is None:
-            try:
-                om_resp = requests.get(
-                    f"https://api.open-meteo.com/v1/elevation?latitude={impact_lat}&longitude={impact_lon}",
-                    timeout=10
-                )
-                om_resp.raise_for_status()
-                om_data = om_resp.json()
-                arr = om_data.get('elevation')
-                if isinstance(arr, list) and len(arr) > 0:
-                    elevation = _to_float(arr[0], 0.0)
-            except Exception:
-                elevation = None
-
-        if elevation is None:
-            elevation = 0.0
-        
         # Calculate impact effects
         impact_effects = calculate_impact_effects(impact_energy_mt, impact_lat, impact_lon, elevation)
         
         # Calculate trajectories
-        original_trajectory = calculate_trajectory(orbital_elements)
+        original_trajectory = _get_trajectory(orbital_elements)
         
         # Apply mitigation if specified
         if mitigation_delta_v > 0:
             deflected_elements = deflect_trajectory(orbital_elements, mitigation_delta_v)
-            deflected_trajectory = calculate_trajectory(deflected_elements)
+            deflected_trajectory = _get_trajectory(deflected_elements)
         else:
             deflected_trajectory = original_trajectory
         
         # Calculate miss distance (simplified)
         miss_distance = calculate_miss_distance(original_trajectory, deflected_trajectory)
         
-        return jsonify({
+        # Trajectories are only displayed, so float32 precision is plenty and
+        # halves the encoded size
+        original_trajectory = original_trajectory.astype(np.float32)
+        deflected_trajectory = deflected_trajectory.astype(np.float32)
+        
+        return ojsonify({
             'success': True,
             'impact_energy_mt': impact_energy_mt,
             'crater_diameter_km': impact_effects['crater_diameter_km'],
@@ -309,14 +542,14 @@ def simulate_impact():
             'original_trajectory': original_trajectory,
             'deflected_trajectory': deflected_trajectory,
             'miss_distance_km': miss_distance,
-            'asteroid_name': asteroid_data.get('object', {}).get('fullname', asteroid_id)
+            'asteroid_name': asteroid_name
         })
     
     except Exception as e:
         print(f"Simulation error: {e}")
         # Return a mock result instead of failing
         asteroid_id = request.get_json().get('asteroidId', 'Unknown') if request.get_json() else 'Unknown'
-        return jsonify({
+        return ojsonify({
             'success': True,
             'impact_energy_mt': 1500,
             'crater_diameter_km': 10.5,
@@ -334,15 +567,18 @@ def calculate_miss_distance(original_traj, deflected_traj):
     """
     Calculate the minimum distance between original and deflected trajectories.
     """
-    min_distance = float('inf')
+    n = min(len(original_traj), len(deflected_traj))
+    if n == 0:
+        return float('inf')
     
-    for i in range(min(len(original_traj), len(deflected_traj))):
-        orig = np.array(original_traj[i])
-        defl = np.array(deflected_traj[i])
-        distance = np.linalg.norm(orig - defl)
-        min_distance = min(min_distance, distance)
+    orig = np.asarray(original_traj[:n], dtype=np.float64)
+    defl = np.asarray(deflected_traj[:n], dtype=np.float64)
     
-    return min_distance / 1000  # Convert to km
+    # Compare squared distances (row-wise dot products, no squared temporary)
+    # and take a single sqrt of the minimum
+    diff = orig - defl
+    squared = np.einsum('ij,ij->i', diff, diff)
+    return math.sqrt(squared.min()) / 1000  # Convert to km
 
 @app.route('/api/simulate/multi', methods=['POST'])
 def simulate_multi_impact():
@@ -354,71 +590,98 @@ def simulate_multi_impact():
         asteroids_data = data.get('asteroids', [])
         
         if not asteroids_data or len(asteroids_data) > 5:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'Please provide 1-5 asteroids'
             }), 400
         
-        all_results = []
-        all_trajectories = []
-        colors = ['#ef4444', '#f59e0b', '#10b981', '#3b82f6', '#8b5cf6']  # Red, Orange, Green, Blue, Purple
+        count = len(asteroids_data)
+        asteroid_ids = []
+        asteroid_names = []
+        impact_lats = np.empty(count)
+        impact_lons = np.empty(count)
+        mitigation_delta_vs = np.empty(count)
+        diameters = np.empty(count)
+        velocities = np.empty(count)
         
         for idx, asteroid_params in enumerate(asteroids_data):
             asteroid_id = asteroid_params.get('asteroidId', f'asteroid-{idx}')
-            impact_lat = float(asteroid_params.get('impactLat', 34.05 + idx * 10))
-            impact_lon = float(asteroid_params.get('impactLon', -118.24 + idx * 15))
-            mitigation_delta_v = float(asteroid_params.get('mitigationDeltaV', 0))
-            diameter = float(asteroid_params.get('diameter', 0.1)) * 1000  # km to m
-            velocity = float(asteroid_params.get('velocity', 20)) * 1000  # km/s to m/s
-            
-            # Calculate impact energy
-            impact_energy_mt = calculate_kinetic_energy(diameter, velocity)
-            
-            # Get elevation (simplified - use 0 for now)
-            elevation = 0
-            
-            # Calculate impact effects
-            impact_effects = calculate_impact_effects(impact_energy_mt, impact_lat, impact_lon, elevation)
-            
-            # Generate orbital elements for trajectory
-            orbital_elements = {
-                'a': 1.5e11 + idx * 0.2e11,
-                'e': 0.1 + idx * 0.05,
-                'i': 0.1 * idx,
-                'omega': 0.5 * idx,
-                'w': 0.3 * idx,
-                'M': 0.2 * idx
-            }
-            
-            # Calculate trajectories
-            original_trajectory = calculate_trajectory(orbital_elements)
-            
-            if mitigation_delta_v > 0:
-                deflected_elements = deflect_trajectory(orbital_elements, mitigation_delta_v)
-                deflected_trajectory = calculate_trajectory(deflected_elements)
-            else:
-                deflected_trajectory = original_trajectory
-            
+            asteroid_ids.append(asteroid_id)
+            asteroid_names.append(asteroid_params.get('name', asteroid_id))
+            impact_lats[idx] = float(asteroid_params.get('impactLat', 34.05 + idx * 10))
+            impact_lons[idx] = float(asteroid_params.get('impactLon', -118.24 + idx * 15))
+            mitigation_delta_vs[idx] = float(asteroid_params.get('mitigationDeltaV', 0))
+            diameters[idx] = float(asteroid_params.get('diameter', 0.1)) * 1000  # km to m
+            velocities[idx] = float(asteroid_params.get('velocity', 20)) * 1000  # km/s to m/s
+        
+        # The effect scalings take logarithms of the energy, so anything but a
+        # positive finite size and speed would come back as NaN or -inf
+        valid = np.isfinite(diameters) & (diameters > 0) & np.isfinite(velocities) & (velocities > 0)
+        if not valid.all():
+            return ojsonify({
+                'success': False,
+                'error': 'Asteroid diameter and velocity must be positive numbers'
+            }), 400
+        
+        # Calculate impact energies
+        impact_energies_mt = calculate_kinetic_energy_batch(diameters, velocities)
+        
+        # Calculate impact effects (elevation simplified - use 0 for now)
+        impact_effects = calculate_impact_effects_batch(impact_energies_mt, np.zeros(count))
+        
+        # Generate orbital elements for trajectory
+        idxs = np.arange(count)
+        a = 1.5e11 + idxs * 0.2e11
+        e = 0.1 + idxs * 0.05
+        i = 0.1 * idxs
+        omega = 0.5 * idxs
+        w = 0.3 * idxs
+        M = 0.2 * idxs
+        
+        # Calculate trajectories for all asteroids in one pass
+        original_trajectories = calculate_trajectories_batch(a, e, i, omega, w, M)
+        deflected_trajectories = list(original_trajectories)
+        
+        deflected = np.flatnonzero(mitigation_delta_vs > 0)
+        if deflected.size:
+            deflected_a = deflect_semi_major_axis_batch(a[deflected], mitigation_delta_vs[deflected])
+            for idx, trajectory in zip(deflected.tolist(), calculate_trajectories_batch(
+                    deflected_a, e[deflected], i[deflected], omega[deflected], w[deflected], M[deflected])):
+                deflected_trajectories[idx] = trajectory
+        
+        # Trajectories are only displayed, so send them as float32
+        original_trajectories = original_trajectories.astype(np.float32)
+        deflected_trajectories = [trajectory.astype(np.float32) for trajectory in deflected_trajectories]
+        
+        impact_lats = impact_lats.tolist()
+        impact_lons = impact_lons.tolist()
+        impact_energies_mt = impact_energies_mt.tolist()
+        impact_effects = {key: values.tolist() for key, values in impact_effects.items()}
+        
+        all_results = []
+        all_trajectories = []
+        
+        for idx in range(count):
             result = {
-                'asteroid_id': asteroid_id,
-                'asteroid_name': asteroid_params.get('name', asteroid_id),
-                'impact_lat': impact_lat,
-                'impact_lon': impact_lon,
-                'impact_energy_mt': impact_energy_mt,
-                'crater_diameter_km': impact_effects['crater_diameter_km'],
-                'tsunami_risk': impact_effects['tsunami_risk'],
-                'seismic_magnitude': impact_effects['seismic_magnitude'],
-                'fireball_radius_km': impact_effects['fireball_radius_km'],
-                'target_type': impact_effects['target_type'],
-                'color': colors[idx % len(colors)]
+                'asteroid_id': asteroid_ids[idx],
+                'asteroid_name': asteroid_names[idx],
+                'impact_lat': impact_lats[idx],
+                'impact_lon': impact_lons[idx],
+                'impact_energy_mt': impact_energies_mt[idx],
+                'crater_diameter_km': impact_effects['crater_diameter_km'][idx],
+                'tsunami_risk': impact_effects['tsunami_risk'][idx],
+                'seismic_magnitude': impact_effects['seismic_magnitude'][idx],
+                'fireball_radius_km': impact_effects['fireball_radius_km'][idx],
+                'target_type': impact_effects['target_type'][idx],
+                'color': COLORS[idx % len(COLORS)]
             }
             
             all_results.append(result)
             all_trajectories.append({
-                'asteroid_id': asteroid_id,
-                'color': colors[idx % len(colors)],
-                'original_trajectory': original_trajectory,
-                'deflected_trajectory': deflected_trajectory
+                'asteroid_id': asteroid_ids[idx],
+                'color': COLORS[idx % len(COLORS)],
+                'original_trajectory': original_trajectories[idx],
+                'deflected_trajectory': deflected_trajectories[idx]
             })
         
         # Calculate combined effects
@@ -430,7 +693,7 @@ def simulate_multi_impact():
             'seismic_magnitude': r['seismic_magnitude']
         } for r in all_results])
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'individual_results': all_results,
             'trajectories': all_trajectories,
@@ -447,7 +710,7 @@ def simulate_multi_impact():
     
     except Exception as e:
         print(f"Multi-simulation error: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -459,8 +722,6 @@ def get_neo_close_approaches():
     Returns the next 7 days of close approach data.
     """
     try:
-        from datetime import datetime, timedelta
-        
         # Get date range (next 7 days)
         start_date = datetime.now().strftime('%Y-%m-%d')
         end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
@@ -471,58 +732,77 @@ def get_neo_close_approaches():
             'api_key': NASA_API_KEY
         }
         
-        response = requests.get(NEO_API_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = _fetch_neo_feed(params)
         
-        close_approaches = []
+        # Flatten every approach into parallel columns in a single pass
+        approach_neos = []
+        approaches = []
+        miss_km = []
+        lunar = []
+        velocities = []
+        diameter_min = []
+        diameter_max = []
+        hazardous = []
+        epochs = []
         
-        # Parse NEO data from each day
-        for date, neos in data.get('near_earth_objects', {}).items():
+        for neos in data.get('near_earth_objects', {}).values():
             for neo in neos:
-                # Get the closest approach for this NEO
+                diameters = neo.get('estimated_diameter', {}).get('meters', {})
+                d_min = diameters.get('estimated_diameter_min', 0)
+                d_max = diameters.get('estimated_diameter_max', 0)
+                is_hazardous = neo.get('is_potentially_hazardous_asteroid', False)
+                
                 for approach in neo.get('close_approach_data', []):
-                    # Calculate risk level based on distance and size
-                    miss_distance_km = float(approach.get('miss_distance', {}).get('kilometers', 0))
-                    diameter_min = neo.get('estimated_diameter', {}).get('meters', {}).get('estimated_diameter_min', 0)
-                    diameter_max = neo.get('estimated_diameter', {}).get('meters', {}).get('estimated_diameter_max', 0)
-                    avg_diameter = (diameter_min + diameter_max) / 2
-                    velocity = float(approach.get('relative_velocity', {}).get('kilometers_per_second', 0))
-                    
-                    # Risk assessment
-                    is_hazardous = neo.get('is_potentially_hazardous_asteroid', False)
-                    lunar_distance = float(approach.get('miss_distance', {}).get('lunar', 0))
-                    
-                    # Determine risk level
-                    if is_hazardous and lunar_distance < 1:
-                        risk_level = 'extreme'
-                    elif is_hazardous and lunar_distance < 5:
-                        risk_level = 'high'
-                    elif lunar_distance < 10:
-                        risk_level = 'moderate'
-                    else:
-                        risk_level = 'low'
-                    
-                    close_approaches.append({
-                        'id': neo.get('id'),
-                        'name': neo.get('name', 'Unknown'),
-                        'close_approach_date': approach.get('close_approach_date_full'),
-                        'epoch_date_close_approach': approach.get('epoch_date_close_approach'),
-                        'miss_distance_km': miss_distance_km,
-                        'miss_distance_lunar': lunar_distance,
-                        'velocity_km_s': velocity,
-                        'diameter_min_m': diameter_min,
-                        'diameter_max_m': diameter_max,
-                        'avg_diameter_m': avg_diameter,
-                        'is_potentially_hazardous': is_hazardous,
-                        'risk_level': risk_level,
-                        'nasa_jpl_url': neo.get('nasa_jpl_url', '')
-                    })
+                    miss_distance = approach.get('miss_distance', {})
+                    approach_neos.append(neo)
+                    approaches.append(approach)
+                    miss_km.append(miss_distance.get('kilometers', 0))
+                    lunar.append(miss_distance.get('lunar', 0))
+                    velocities.append(approach.get('relative_velocity', {}).get('kilometers_per_second', 0))
+                    diameter_min.append(d_min)
+                    diameter_max.append(d_max)
+                    hazardous.append(is_hazardous)
+                    epochs.append(approach.get('epoch_date_close_approach') or 0)
+        
+        # Convert the string-valued columns in bulk
+        miss_km = np.array(miss_km, dtype=np.float64)
+        lunar = np.array(lunar, dtype=np.float64)
+        velocities = np.array(velocities, dtype=np.float64)
+        avg_diameter = (np.array(diameter_min, dtype=np.float64) + np.array(diameter_max, dtype=np.float64)) / 2
+        is_hazardous = np.array(hazardous, dtype=bool)
+        
+        # Risk assessment based on hazard flag and lunar distance
+        risk_levels = np.select(
+            [is_hazardous & (lunar < 1), is_hazardous & (lunar < 5), lunar < 10],
+            ['extreme', 'high', 'moderate'],
+            default='low'
+        ).tolist()
+        
+        miss_km = miss_km.tolist()
+        lunar = lunar.tolist()
+        velocities = velocities.tolist()
+        avg_diameter = avg_diameter.tolist()
         
         # Sort by close approach date
-        close_approaches.sort(key=lambda x: x.get('epoch_date_close_approach', 0))
-        
-        return jsonify({
+        order = np.argsort(np.array(epochs, dtype=np.int64), kind='stable').tolist()
+        
+        close_approaches = [{
+            'id': approach_neos[idx].get('id'),
+            'name': approach_neos[idx].get('name', 'Unknown'),
+            'close_approach_date': approaches[idx].get('close_approach_date_full'),
+            'epoch_date_close_approach': approaches[idx].get('epoch_date_close_approach'),
+            'miss_distance_km': miss_km[idx],
+            'miss_distance_lunar': lunar[idx],
+            'velocity_km_s': velocities[idx],
+            'diameter_min_m': diameter_min[idx],
+            'diameter_max_m': diameter_max[idx],
+            'avg_diameter_m': avg_diameter[idx],
+            'is_potentially_hazardous': hazardous[idx],
+            'risk_level': risk_levels[idx],
+            'nasa_jpl_url': approach_neos[idx].get('nasa_jpl_url', '')
+        } for idx in order]
+        
+        return ojsonify({
             'success': True,
             'count': len(close_approaches),
             'start_date': start_date,
@@ -533,7 +813,7 @@ def get_neo_close_approaches():
     except Exception as e:
         print(f"NEO API error: {e}")
         # Return fallback data for demo purposes
-        return jsonify({
+        return ojsonify({
             'success': True,
             'count': 3,
             'start_date': '2026-02-05',
@@ -594,12 +874,12 @@ def get_historical_impacts():
     """
     try:
         impacts = get_all_historical_impacts()
-        return jsonify({
+        return ojsonify({
             'success': True,
             'impacts': impacts
         })
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -617,17 +897,17 @@ def compare_to_historical():
         comparison = find_closest_comparison(energy_mt, crater_km)
         
         if not comparison:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'Invalid energy value'
             }), 400
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             **comparison
         })
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -637,7 +917,7 @@ def health_check():
     """
     Health check endpoint.
     """
-    return jsonify({
+    return ojsonify({
         'status': 'healthy',
         'service': 'AstroGuard API'
     })
@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration for AstroGuard.
+
+Every endpoint is I/O-bound on external APIs, so gevent workers let each
+process serve many requests while upstream calls are in flight.
+"""
+import os
+
+wsgi_app = 'wsgi:application'
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = 4
+worker_class = 'gevent'
+worker_connections = 1000
+timeout = 60
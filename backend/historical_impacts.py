@@ -1,126 +1,199 @@
 """
 Historical asteroid impact events database for comparison in simulations.
 """
+import functools
+import math
+from collections import namedtuple
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+
+import numpy as np
+
+Impact = namedtuple('Impact', [
+    'id', 'name', 'location', 'age_years', 'age_display', 'crater_diameter_km',
+    'energy_mt', 'energy_display', 'asteroid_diameter_km', 'description',
+    'effects', 'emoji',
+])
 
 # Famous historical impacts with estimated energy and crater data
-HISTORICAL_IMPACTS = [
-    {
-        'id': 'chicxulub',
-        'name': 'Chicxulub Impact',
-        'location': 'Yucatan Peninsula, Mexico',
-        'age_years': 66_000_000,
-        'age_display': '66 million years ago',
-        'crater_diameter_km': 150,
-        'energy_mt': 100_000_000_000,  # 100 teratons
-        'energy_display': '100 Teratons',
-        'asteroid_diameter_km': 10,
-        'description': 'Mass extinction event that killed the dinosaurs',
-        'effects': 'Global winter, 75% species extinction, mega-tsunamis',
-        'emoji': '🦕'
-    },
-    {
-        'id': 'vredefort',
-        'name': 'Vredefort Crater',
-        'location': 'South Africa',
-        'age_years': 2_023_000_000,
-        'age_display': '2 billion years ago',
-        'crater_diameter_km': 300,
-        'energy_mt': 500_000_000_000,  # 500 teratons
-        'energy_display': '500 Teratons',
-        'asteroid_diameter_km': 15,
-        'description': 'Largest verified impact crater on Earth',
-        'effects': 'Massive global devastation',
-        'emoji': '💫'
-    },
-    {
-        'id': 'sudbury',
-        'name': 'Sudbury Basin',
-        'location': 'Ontario, Canada',
-        'age_years': 1_849_000_000,
-        'age_display': '1.85 billion years ago',
-        'crater_diameter_km': 130,
-        'energy_mt': 60_000_000_000,  # 60 teratons
-        'energy_display': '60 Teratons',
-        'asteroid_diameter_km': 10,
-        'description': 'One of the largest impact structures on Earth',
-        'effects': 'Created major nickel deposits',
-        'emoji': '⛏️'
-    },
-    {
-        'id': 'popigai',
-        'name': 'Popigai Crater',
-        'location': 'Siberia, Russia',
-        'age_years': 35_700_000,
-        'age_display': '35.7 million years ago',
-        'crater_diameter_km': 100,
-        'energy_mt': 30_000_000_000,  # 30 teratons
-        'energy_display': '30 Teratons',
-        'asteroid_diameter_km': 8,
-        'description': 'Fourth largest verified crater, contains impact diamonds',
-        'effects': 'Massive regional destruction, diamond formation',
-        'emoji': '💎'
-    },
-    {
-        'id': 'barringer',
-        'name': 'Barringer Crater',
-        'location': 'Arizona, USA',
-        'age_years': 50_000,
-        'age_display': '50,000 years ago',
-        'crater_diameter_km': 1.2,
-        'energy_mt': 10,
-        'energy_display': '10 Megatons',
-        'asteroid_diameter_km': 0.05,
-        'description': 'Best preserved impact crater on Earth',
-        'effects': '175m deep crater, everything within 4km destroyed',
-        'emoji': '🏜️'
-    },
-    {
-        'id': 'tunguska',
-        'name': 'Tunguska Event',
-        'location': 'Siberia, Russia',
-        'age_years': 116,  # 1908
-        'age_display': '1908',
-        'crater_diameter_km': 0,  # Airburst
-        'energy_mt': 15,
-        'energy_display': '10-15 Megatons',
-        'asteroid_diameter_km': 0.06,
-        'description': 'Largest impact event in recorded history (airburst)',
-        'effects': '2,150 km² of forest flattened, no crater',
-        'emoji': '💥'
-    },
-    {
-        'id': 'chelyabinsk',
-        'name': 'Chelyabinsk Meteor',
-        'location': 'Chelyabinsk, Russia',
-        'age_years': 13,  # 2013
-        'age_display': '2013',
-        'crater_diameter_km': 0,  # Airburst
-        'energy_mt': 0.5,
-        'energy_display': '500 Kilotons',
-        'asteroid_diameter_km': 0.02,
-        'description': 'Largest undetected asteroid to enter atmosphere',
-        'effects': '1,500 injuries, mostly from broken glass',
-        'emoji': '🌠'
-    },
-    {
-        'id': 'hiroshima',
-        'name': 'Hiroshima Bomb (Reference)',
-        'location': 'Hiroshima, Japan',
-        'age_years': 81,  # 1945
-        'age_display': '1945',
-        'crater_diameter_km': 0,
-        'energy_mt': 0.015,  # 15 kilotons
-        'energy_display': '15 Kilotons',
-        'asteroid_diameter_km': 0,
-        'description': 'Nuclear weapon reference for energy comparison',
-        'effects': 'Destroyed 13 km² area',
-        'emoji': '☢️'
-    }
-]
+HISTORICAL_IMPACTS = (
+    Impact(
+        id='chicxulub',
+        name='Chicxulub Impact',
+        location='Yucatan Peninsula, Mexico',
+        age_years=66_000_000,
+        age_display='66 million years ago',
+        crater_diameter_km=150,
+        energy_mt=100_000_000_000,  # 100 teratons
+        energy_display='100 Teratons',
+        asteroid_diameter_km=10,
+        description='Mass extinction event that killed the dinosaurs',
+        effects='Global winter, 75% species extinction, mega-tsunamis',
+        emoji='🦕'
+    ),
+    Impact(
+        id='vredefort',
+        name='Vredefort Crater',
+        location='South Africa',
+        age_years=2_023_000_000,
+        age_display='2 billion years ago',
+        crater_diameter_km=300,
+        energy_mt=500_000_000_000,  # 500 teratons
+        energy_display='500 Teratons',
+        asteroid_diameter_km=15,
+        description='Largest verified impact crater on Earth',
+        effects='Massive global devastation',
+        emoji='💫'
+    ),
+    Impact(
+        id='sudbury',
+        name='Sudbury Basin',
+        location='Ontario, Canada',
+        age_years=1_849_000_000,
+        age_display='1.85 billion years ago',
+        crater_diameter_km=130,
+        energy_mt=60_000_000_000,  # 60 teratons
+        energy_display='60 Teratons',
+        asteroid_diameter_km=10,
+        description='One of the largest impact structures on Earth',
+        effects='Created major nickel deposits',
+        emoji='⛏️'
+    ),
+    Impact(
+        id='popigai',
+        name='Popigai Crater',
+        location='Siberia, Russia',
+        age_years=35_700_000,
+        age_display='35.7 million years ago',
+        crater_diameter_km=100,
+        energy_mt=30_000_000_000,  # 30 teratons
+        energy_display='30 Teratons',
+        asteroid_diameter_km=8,
+        description='Fourth largest verified crater, contains impact diamonds',
+        effects='Massive regional destruction, diamond formation',
+        emoji='💎'
+    ),
+    Impact(
+        id='barringer',
+        name='Barringer Crater',
+        location='Arizona, USA',
+        age_years=50_000,
+        age_display='50,000 years ago',
+        crater_diameter_km=1.2,
+        energy_mt=10,
+        energy_display='10 Megatons',
+        asteroid_diameter_km=0.05,
+        description='Best preserved impact crater on Earth',
+        effects='175m deep crater, everything within 4km destroyed',
+        emoji='🏜️'
+    ),
+    Impact(
+        id='tunguska',
+        name='Tunguska Event',
+        location='Siberia, Russia',
+        age_years=116,  # 1908
+        age_display='1908',
+        crater_diameter_km=0,  # Airburst
+        energy_mt=15,
+        energy_display='10-15 Megatons',
+        asteroid_diameter_km=0.06,
+        description='Largest impact event in recorded history (airburst)',
+        effects='2,150 km² of forest flattened, no crater',
+        emoji='💥'
+    ),
+    Impact(
+        id='chelyabinsk',
+        name='Chelyabinsk Meteor',
+        location='Chelyabinsk, Russia',
+        age_years=13,  # 2013
+        age_display='2013',
+        crater_diameter_km=0,  # Airburst
+        energy_mt=0.5,
+        energy_display='500 Kilotons',
+        asteroid_diameter_km=0.02,
+        description='Largest undetected asteroid to enter atmosphere',
+        effects='1,500 injuries, mostly from broken glass',
+        emoji='🌠'
+    ),
+    Impact(
+        id='hiroshima',
+        name='Hiroshima Bomb (Reference)',
+        location='Hiroshima, Japan',
+        age_years=81,  # 1945
+        age_display='1945',
+        crater_diameter_km=0,
+        energy_mt=0.015,  # 15 kilotons
+        energy_display='15 Kilotons',
+        asteroid_diameter_km=0,
+        description='Nuclear weapon reference for energy comparison',
+        effects='Destroyed 13 km² area',
+        emoji='☢️'
+    )
+)
+
+# Column layout of the dataset, sorted by energy: the hot numeric fields are
+# contiguous arrays and _META holds the full record at the same index
+_META = sorted(HISTORICAL_IMPACTS, key=attrgetter('energy_mt'))
+_ENERGY_MT = np.array([impact.energy_mt for impact in _META], dtype=np.float64)
+_CRATER_DIAMETER_KM = np.array([impact.crater_diameter_km for impact in _META], dtype=np.float64)
+
+# Read-only dict views of the records, shared by every response without
+# copying: _IMPACT_VIEWS in dataset order, _META_VIEWS aligned with _META
+_IMPACT_VIEWS = tuple(MappingProxyType(impact._asdict()) for impact in HISTORICAL_IMPACTS)
+_META_VIEWS = tuple(sorted(_IMPACT_VIEWS, key=itemgetter('energy_mt')))
+
+# Two candidates whose energy ratios are within 20% of each other count as a
+# tie, which the crater diameter (when known for both) decides
+_CRATER_TIE_LOG_RATIO = math.log(1.2)
+
+# Most energetic impact; anything 100x beyond it is "vastly larger" outright
+_MAX_IMPACT = _META[-1]
+_MAX_ENERGY = _MAX_IMPACT.energy_mt
+
+# Log energies for symmetric ratio distance; unknown (zero) energies map to -inf
+with np.errstate(divide='ignore'):
+    _LOG_ENERGY_MT = np.log(_ENERGY_MT)
+
+# Bound str.format methods for the comparison wording, built once at import
+_FMT_MUCH_SMALLER = "much smaller than {}".format
+_FMT_FRACTION = "about 1/{} the energy of {}".format
+_FMT_PERCENT = "about {}% the energy of {}".format
+_FMT_COMPARABLE = "comparable to {}".format
+_FMT_MULTIPLE = "about {:.1f}x {}".format
+_FMT_LARGE_MULTIPLE = "about {}x {}".format
+_FMT_VASTLY_LARGER = "vastly larger than {}".format
+
+# Hiroshima yield in megatons (15 kilotons)
+_HIROSHIMA_ENERGY_MT = 0.015
+_HIROSHIMA_TEXT_FMT = "Equivalent to {:,} Hiroshima bombs".format
+# Beyond a billion bombs the exact count is noise; use scientific notation
+_HIROSHIMA_SCI_THRESHOLD = 1e9
+_HIROSHIMA_SCI_TEXT_FMT = "Equivalent to {:.2e} Hiroshima bombs".format
+
+# Comparison wording by decade of the energy ratio, floor(log10(ratio)),
+# clamped to [-3, 2]. Each entry pairs a function picking the value the
+# wording displays from (ratio, inv_ratio) with the formatter for that value.
+# Decades -1 and 0 straddle the "comparable" band, which displays no value
+# (None); otherwise they display the ratio already rounded the way it prints,
+# so that only distinct strings take up cache entries
+_DECADE_HANDLERS = {
+    -3: (lambda ratio, inv_ratio: None,
+         lambda value, name: _FMT_MUCH_SMALLER(name)),
+    -2: (lambda ratio, inv_ratio: int(inv_ratio),
+         _FMT_FRACTION),
+    -1: (lambda ratio, inv_ratio: round(ratio * 100) if ratio < 0.5 else None,
+         lambda value, name: _FMT_COMPARABLE(name) if value is None else _FMT_PERCENT(value, name)),
+    0: (lambda ratio, inv_ratio: None if ratio < 2 else round(ratio, 1),
+        lambda value, name: _FMT_COMPARABLE(name) if value is None else _FMT_MULTIPLE(value, name)),
+    1: (lambda ratio, inv_ratio: int(ratio),
+        _FMT_LARGE_MULTIPLE),
+    2: (lambda ratio, inv_ratio: None,
+        lambda value, name: _FMT_VASTLY_LARGER(name)),
+}
 
 def get_all_historical_impacts():
-    """Return all historical impact data."""
-    return HISTORICAL_IMPACTS
+    """Return all historical impact data as read-only mappings."""
+    return _IMPACT_VIEWS
 
 def find_closest_comparison(energy_mt: float, crater_km: float = None):
     """
@@ -131,64 +204,89 @@ def find_closest_comparison(energy_mt: float, crater_km: float = None):
         crater_km: Optional crater diameter in km
         
     Returns:
-        Dictionary with comparison data
+        Read-only mapping with comparison data
     """
     if energy_mt <= 0:
         return None
     
-    # Sort by energy to find closest match
-    sorted_impacts = sorted(HISTORICAL_IMPACTS, key=lambda x: x['energy_mt'])
-    
-    closest = None
-    min_ratio_diff = float('inf')
+    if crater_km is not None:
+        crater_km = float(crater_km)
+    return _find_closest_cached(float(energy_mt), crater_km)
+
+@functools.lru_cache(maxsize=256)
+def _find_closest_cached(energy_mt: float, crater_km: float = None):
+    """
+    Comparison data for a positive energy. The dataset is static, so repeated
+    queries (e.g. re-running a simulation) are served from the cache.
+    """
+    # Calculate Hiroshima equivalent
+    # Divide rather than multiply by a reciprocal: the extra rounding step
+    # would flip whole counts, e.g. 1,999 to 2,000 just below 30 MT
+    hiroshima_equivalent = energy_mt / _HIROSHIMA_ENERGY_MT
+    if hiroshima_equivalent > _HIROSHIMA_SCI_THRESHOLD:
+        hiroshima_text = _HIROSHIMA_SCI_TEXT_FMT(hiroshima_equivalent)
+    else:
+        hiroshima_text = _HIROSHIMA_TEXT_FMT(int(hiroshima_equivalent))
     
-    for impact in sorted_impacts:
-        if impact['energy_mt'] > 0:
-            ratio = energy_mt / impact['energy_mt']
-            ratio_diff = abs(1 - ratio) if ratio <= 1 else abs(ratio - 1)
-            
-            if ratio_diff < min_ratio_diff:
-                min_ratio_diff = ratio_diff
-                closest = impact
+    if energy_mt >= 100 * _MAX_ENERGY:
+        return MappingProxyType({
+            'closest_impact': _META_VIEWS[-1],
+            'energy_ratio': energy_mt / _MAX_ENERGY,
+            'comparison_text': _FMT_VASTLY_LARGER(_MAX_IMPACT.name),
+            'hiroshima_equivalent': hiroshima_equivalent,
+            'hiroshima_text': hiroshima_text
+        })
     
-    if not closest:
-        closest = HISTORICAL_IMPACTS[0]
+    # Closeness is |log(ratio)| so that 0.5x and 2x count as equally close;
+    # impacts without a known energy are infinitely far and never chosen
+    distance = np.abs(math.log(energy_mt) - _LOG_ENERGY_MT)
+    if crater_km is None:
+        idx = int(distance.argmin())
+    else:
+        first, second = np.argsort(distance, kind='stable')[:2]
+        idx = int(first)
+        craters = _CRATER_DIAMETER_KM[[first, second]]
+        crater_gap = np.abs(craters - crater_km)
+        # A 0 km crater marks an airburst (no crater), not a tiny crater, so
+        # it cannot be compared against the simulated crater
+        if (distance[second] - distance[first] <= _CRATER_TIE_LOG_RATIO and
+                (craters > 0).all() and crater_gap[1] < crater_gap[0]):
+            idx = int(second)
     
-    # Calculate comparison ratio
-    ratio = energy_mt / closest['energy_mt'] if closest['energy_mt'] > 0 else 0
+    closest = _META[idx]
+    ratio = energy_mt / closest.energy_mt
+    # Both energies are positive here, so the ratio is never zero
+    inv_ratio = 1.0 / ratio
     
-    # Generate comparison message
-    if ratio < 0.01:
-        comparison_text = f"much smaller than {closest['name']}"
-    elif ratio < 0.1:
-        comparison_text = f"about 1/{int(1/ratio)} the energy of {closest['name']}"
-    elif ratio < 0.5:
-        comparison_text = f"about {ratio:.0%} the energy of {closest['name']}"
-    elif ratio < 2:
-        comparison_text = f"comparable to {closest['name']}"
-    elif ratio < 10:
-        comparison_text = f"about {ratio:.1f}x {closest['name']}"
-    elif ratio < 100:
-        comparison_text = f"about {int(ratio)}x {closest['name']}"
-    else:
-        comparison_text = f"vastly larger than {closest['name']}"
-
-    # Calculate Hiroshima equivalent
-    hiroshima_energy = 0.015  # 15 kilotons
-    hiroshima_equivalent = energy_mt / hiroshima_energy
+    # Generate comparison message; log10 can round up just below a power of
+    # ten, so step back a decade when the ratio is under its lower bound
+    decade = math.floor(math.log10(ratio))
+    if ratio < 10.0 ** decade:
+        decade -= 1
+    decade = max(-3, min(2, decade))
+    display_value = _DECADE_HANDLERS[decade][0](ratio, inv_ratio)
+    comparison_text = _comparison_text(idx, decade, display_value)
     
-    return {
-        'closest_impact': closest,
+    return MappingProxyType({
+        'closest_impact': _META_VIEWS[idx],
         'energy_ratio': ratio,
         'comparison_text': comparison_text,
         'hiroshima_equivalent': hiroshima_equivalent,
-        'hiroshima_text': f"Equivalent to {int(hiroshima_equivalent):,} Hiroshima bombs"
-    }
+        'hiroshima_text': hiroshima_text
+    })
+
+@functools.lru_cache(maxsize=1024)
+def _comparison_text(index: int, decade: int, display_value):
+    """
+    Comparison wording against _META[index]. Keyed by the value the wording
+    actually displays, so nearby energies share one formatted string.
+    """
+    return _DECADE_HANDLERS[decade][1](display_value, _META[index].name)
 
 def get_impacts_larger_than(energy_mt: float):
-    """Get all historical impacts larger than the given energy."""
-    return [i for i in HISTORICAL_IMPACTS if i['energy_mt'] > energy_mt]
+    """Get all historical impacts larger than the given energy, smallest first."""
+    return [_META_VIEWS[k] for k in np.flatnonzero(_ENERGY_MT > energy_mt)]
 
 def get_impacts_smaller_than(energy_mt: float):
-    """Get all historical impacts smaller than the given energy."""
-    return [i for i in HISTORICAL_IMPACTS if i['energy_mt'] < energy_mt]
+    """Get all historical impacts smaller than the given energy, smallest first."""
+    return [_META_VIEWS[k] for k in np.flatnonzero(_ENERGY_MT < energy_mt)]
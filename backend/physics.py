@@ -2,7 +2,7 @@
 Physics engine for asteroid impact calculations and orbital mechanics.
 """
 import numpy as np
-from typing import List, Tuple, Dict, Any
+from typing import List, Dict, Any
 import math
 
 # Constants
@@ -11,6 +11,7 @@ EARTH_MASS = 5.972e24  # kg
 G = 6.67430e-11  # gravitational constant
 ASTEROID_DENSITY = 3000  # kg/m³ (typical for rocky asteroids)
 TNT_ENERGY = 4.184e9  # Joules per ton of TNT
+MAX_ECCENTRICITY = 0.9999  # closed orbits only; higher values are clamped
 
 def calculate_kinetic_energy(diameter: float, velocity: float) -> float:
     """
@@ -36,6 +37,22 @@ def calculate_kinetic_energy(diameter: float, velocity: float) -> float:
     
     return megatons_tnt
 
+def calculate_kinetic_energy_batch(diameters: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_kinetic_energy for many asteroids at once.
+    
+    Args:
+        diameters: Asteroid diameters in meters, shape (N,)
+        velocities: Impact velocities in m/s, shape (N,)
+        
+    Returns:
+        Energies in megatons of TNT, shape (N,)
+    """
+    radius = np.asarray(diameters, dtype=np.float64) / 2
+    mass = (4/3) * math.pi * radius**3 * ASTEROID_DENSITY
+    kinetic_energy = 0.5 * mass * np.asarray(velocities, dtype=np.float64)**2
+    return kinetic_energy / (TNT_ENERGY * 1e6)
+
 def estimate_crater_diameter(energy_mt: float, target_type: str = 'rock') -> float:
     """
     Estimate crater diameter using scaling laws.
@@ -60,7 +77,7 @@ def estimate_crater_diameter(energy_mt: float, target_type: str = 'rock') -> flo
     
     return diameter_m / 1000  # Convert to kilometers
 
-def calculate_trajectory(orbital_elements: Dict[str, float], time_steps: int = 100) -> List[List[float]]:
+def calculate_trajectory(orbital_elements: Dict[str, float], time_steps: int = 100) -> np.ndarray:
     """
     Calculate asteroid trajectory from orbital elements.
     
@@ -69,7 +86,7 @@ def calculate_trajectory(orbital_elements: Dict[str, float], time_steps: int = 1
         time_steps: Number of points to calculate
         
     Returns:
-        List of [x, y, z] coordinates in meters
+        Array of shape (time_steps, 3) holding [x, y, z] coordinates in meters
     """
     a = orbital_elements.get('a', 1.5e11)  # semi-major axis in meters
     e = orbital_elements.get('e', 0.1)     # eccentricity
@@ -78,58 +95,64 @@ def calculate_trajectory(orbital_elements: Dict[str, float], time_steps: int = 1
     w = orbital_elements.get('w', 0)       # argument of periapsis
     M = orbital_elements.get('M', 0)       # mean anomaly
     
-    # Generate time array (one orbital period)
-    T = 2 * math.pi * math.sqrt(a**3 / (G * EARTH_MASS))
-    times = np.linspace(0, T, time_steps)
-    
-    trajectory = []
+    # Propagate all time samples at once with the vectorized kernel
+    return calculate_trajectories_batch([a], [e], [i], [omega], [w], [M], time_steps)[0]
+
+def calculate_trajectories_batch(a: np.ndarray, e: np.ndarray, i: np.ndarray, omega: np.ndarray,
+                                 w: np.ndarray, M: np.ndarray, time_steps: int = 100) -> np.ndarray:
+    """
+    Vectorized calculate_trajectory for N sets of orbital elements.
     
-    for t in times:
-        # Solve Kepler's equation for eccentric anomaly
-        E = solve_kepler_equation(M + 2 * math.pi * t / T, e)
-        
-        # Calculate position in orbital plane
-        r = a * (1 - e * math.cos(E))
-        x_orb = r * math.cos(E)
-        y_orb = r * math.sin(E)
-        z_orb = 0
-        
-        # Transform to 3D space
-        x, y, z = transform_orbital_to_cartesian(x_orb, y_orb, z_orb, i, omega, w)
+    Args:
+        a, e, i, omega, w, M: Keplerian elements, each of shape (N,)
+        time_steps: Number of points to calculate per trajectory
         
-        trajectory.append([x, y, z])
-    
-    return trajectory
+    Returns:
+        Array of shape (N, time_steps, 3) holding [x, y, z] coordinates in meters
+    """
+    # Column vectors so every element broadcasts across the time samples
+    a, e, i, omega, w, M = (np.asarray(v, dtype=np.float64)[:, None] for v in (a, e, i, omega, w, M))
+    # This model only draws ellipses; parabolic and hyperbolic objects (e >= 1,
+    # possible for comets in SBDB) are drawn as the most eccentric ellipse
+    e = np.clip(e, 0.0, MAX_ECCENTRICITY)
+    
+    # Sample one orbital period; only the fraction of the period matters
+    mean_anomaly = M + 2 * math.pi * np.linspace(0, 1, time_steps)
+    E = solve_kepler_equation_batch(mean_anomaly, e)
+    
+    # Position in orbital plane
+    r = a * (1 - e * np.cos(E))
+    x_orb = r * np.cos(E)
+    y_orb = r * np.sin(E)
+    
+    # Transform to 3D space
+    cos_i, sin_i = np.cos(i), np.sin(i)
+    cos_omega, sin_omega = np.cos(omega), np.sin(omega)
+    cos_w, sin_w = np.cos(w), np.sin(w)
+    
+    x = x_orb * (cos_w * cos_omega - sin_w * sin_omega * cos_i) - y_orb * (sin_w * cos_omega + cos_w * sin_omega * cos_i)
+    y = x_orb * (cos_w * sin_omega + sin_w * cos_omega * cos_i) + y_orb * (cos_w * cos_omega - sin_w * sin_omega * cos_i)
+    z = x_orb * (sin_w * sin_i) + y_orb * (cos_w * sin_i)
+    
+    return np.stack((x, y, z), axis=-1)
 
-def solve_kepler_equation(M: float, e: float, max_iterations: int = 100) -> float:
+def solve_kepler_equation_batch(M: np.ndarray, e: np.ndarray, max_iterations: int = 50) -> np.ndarray:
     """
-    Solve Kepler's equation: M = E - e*sin(E)
+    Solve Kepler's equation element-wise with Newton's method.
+    M and e must broadcast against each other, with 0 <= e < 1.
     """
-    E = M  # Initial guess
+    # Wrap M into [-pi, pi]; positions only depend on E modulo 2*pi
+    M = np.remainder(M + math.pi, 2 * math.pi) - math.pi
+    # Starting 0.85*e towards the apoapsis side keeps Newton from
+    # overshooting near periapsis at high eccentricity
+    E = M + 0.85 * e * np.sign(np.sin(M))
     for _ in range(max_iterations):
-        E_new = M + e * math.sin(E)
-        if abs(E_new - E) < 1e-8:
+        delta = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        E = E - delta
+        if np.max(np.abs(delta)) < 1e-12:
             break
-        E = E_new
     return E
 
-def transform_orbital_to_cartesian(x: float, y: float, z: float, 
-                                 i: float, omega: float, w: float) -> Tuple[float, float, float]:
-    """
-    Transform from orbital plane coordinates to 3D Cartesian coordinates.
-    """
-    # Rotation matrices for orbital elements
-    cos_i, sin_i = math.cos(i), math.sin(i)
-    cos_omega, sin_omega = math.cos(omega), math.sin(omega)
-    cos_w, sin_w = math.cos(w), math.sin(w)
-    
-    # Apply rotations
-    x_rot = x * (cos_w * cos_omega - sin_w * sin_omega * cos_i) - y * (sin_w * cos_omega + cos_w * sin_omega * cos_i)
-    y_rot = x * (cos_w * sin_omega + sin_w * cos_omega * cos_i) + y * (cos_w * cos_omega - sin_w * sin_omega * cos_i)
-    z_rot = x * (sin_w * sin_i) + y * (cos_w * sin_i)
-    
-    return x_rot, y_rot, z_rot
-
 def deflect_trajectory(orbital_elements: Dict[str, float], delta_v: float) -> Dict[str, float]:
     """
     Apply a velocity change to deflect an asteroid.
@@ -159,6 +182,14 @@ def deflect_trajectory(orbital_elements: Dict[str, float], delta_v: float) -> Di
     
     return new_elements
 
+def deflect_semi_major_axis_batch(a: np.ndarray, delta_v: np.ndarray) -> np.ndarray:
+    """
+    Vectorized deflect_trajectory: new semi-major axes after applying each
+    velocity change (m/s) to the matching semi-major axis (m).
+    """
+    v_new = np.sqrt(G * EARTH_MASS / np.asarray(a, dtype=np.float64)) + delta_v
+    return G * EARTH_MASS / v_new**2
+
 def calculate_impact_effects(energy_mt: float, impact_lat: float, impact_lon: float, 
                            elevation: float) -> Dict[str, Any]:
     """
@@ -197,6 +228,33 @@ def calculate_impact_effects(energy_mt: float, impact_lat: float, impact_lon: fl
         'energy_megatons': energy_mt
     }
 
+def calculate_impact_effects_batch(energies_mt: np.ndarray, elevations: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized calculate_impact_effects for many impacts at once.
+    
+    Args:
+        energies_mt: Impact energies in megatons of TNT, shape (N,)
+        elevations: Surface elevations at the impact sites, shape (N,)
+        
+    Returns:
+        Dictionary of impact effect arrays, each of shape (N,)
+    """
+    energies_mt = np.asarray(energies_mt, dtype=np.float64)
+    underwater = np.asarray(elevations) < 0
+    
+    # Holsapple-Schmidt scaling; water targets produce smaller craters
+    energy_joules = energies_mt * TNT_ENERGY * 1e6
+    crater_diameter = np.where(underwater, 1.2, 1.8) * (energy_joules / 1e12)**0.294 / 1000
+    
+    return {
+        'crater_diameter_km': crater_diameter,
+        'tsunami_risk': underwater & (energies_mt > 10),
+        'seismic_magnitude': 4.5 + 0.67 * np.log10(energies_mt),
+        'fireball_radius_km': 1.5 * energies_mt**0.4,
+        'target_type': np.where(underwater, 'water', 'rock'),
+        'energy_megatons': energies_mt
+    }
+
 def calculate_combined_effects(impacts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate combined effects from multiple asteroid impacts.
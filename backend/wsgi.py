@@ -0,0 +1,10 @@
+"""
+WSGI entry point for running AstroGuard under gunicorn with gevent workers.
+"""
+# Patch blocking I/O before requests (imported by app) opens any sockets
+from gevent import monkey
+monkey.patch_all()
+
+from app import app
+
+application = app